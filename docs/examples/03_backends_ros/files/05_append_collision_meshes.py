@@ -2,6 +2,7 @@ import time
 
 from compas.datastructures import Mesh
 from compas.geometry import Box
+from compas.geometry import Frame
 
 from compas_fab.backends import RosClient
 from compas_fab.robots import CollisionMesh
@@ -13,14 +14,14 @@ with RosClient() as client:
     assert robot.name == 'ur5_robot'
 
     brick = Box.from_width_height_depth(0.11, 0.07, 0.25)
+    mesh = Mesh.from_vertices_and_faces(brick.vertices, brick.faces)
 
+    bricks = []
     for i in range(5):
-        mesh = Mesh.from_vertices_and_faces(brick.vertices, brick.faces)
-        cm = CollisionMesh(mesh, 'brick')
-        cm.frame.point.y += 0.5
-        cm.frame.point.z += brick.zsize * i
+        frame = Frame([0, 0.5, brick.zsize * i], [1, 0, 0], [0, 1, 0])
+        bricks.append(CollisionMesh(mesh, 'brick', frame))
 
-        scene.append_collision_mesh(cm)
+    scene.append_collision_meshes(bricks)
 
     # sleep a bit before removing the bricks
     time.sleep(1)
@@ -291,8 +291,9 @@ class AppendCollisionMesh(object):
 
         Parameters
         ----------
-        collision_mesh : :class:`compas_fab.robots.CollisionMesh`
-            Object containing the collision mesh to be appended.
+        collision_mesh : :class:`compas_fab.robots.CollisionMesh` or :obj:`list` of :class:`compas_fab.robots.CollisionMesh`
+            Object containing the collision mesh to be appended, or a list
+            of them to be appended at once.
         options : dict, optional
             Dictionary containing kwargs for arguments specific to
             the client being queried.
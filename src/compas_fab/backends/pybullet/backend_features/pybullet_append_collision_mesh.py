@@ -19,8 +19,9 @@ class PyBulletAppendCollisionMesh(AppendCollisionMesh):
 
         Parameters
         ----------
-        collision_mesh : :class:`compas_fab.robots.CollisionMesh`
-            Object containing the collision mesh to be appended.
+        collision_mesh : :class:`compas_fab.robots.CollisionMesh` or :obj:`list` of :class:`compas_fab.robots.CollisionMesh`
+            Object containing the collision mesh to be appended, or a list
+            of them to be appended one after the other.
         options : dict
             Dictionary containing the following key-value pairs:
 
@@ -32,6 +33,11 @@ class PyBulletAppendCollisionMesh(AppendCollisionMesh):
         -------
         ``None``
         """
+        if isinstance(collision_mesh, (list, tuple)):
+            for cm in collision_mesh:
+                self.append_collision_mesh(cm, options)
+            return
+
         mesh = collision_mesh.mesh
         name = collision_mesh.id
         frame = collision_mesh.frame
@@ -33,8 +33,10 @@ class MoveItAppendCollisionMesh(AppendCollisionMesh):
 
         Parameters
         ----------
-        collision_mesh : :class:`compas_fab.robots.CollisionMesh`
-            Object containing the collision mesh to be appended.
+        collision_mesh : :class:`compas_fab.robots.CollisionMesh` or :obj:`list` of :class:`compas_fab.robots.CollisionMesh`
+            Object containing the collision mesh to be appended. If a list
+            is given, all collision meshes are appended in a single planning
+            scene update.
         options : dict, optional
             Unused parameter.
 
@@ -49,9 +51,11 @@ class MoveItAppendCollisionMesh(AppendCollisionMesh):
         return await_callback(self.append_collision_mesh_async, **kwargs)
 
     def append_collision_mesh_async(self, callback, errback, collision_mesh):
-        co = CollisionObject.from_collision_mesh(collision_mesh)
-        co.operation = CollisionObject.APPEND
-        world = PlanningSceneWorld(collision_objects=[co])
+        collision_meshes = collision_mesh if isinstance(collision_mesh, (list, tuple)) else [collision_mesh]
+        collision_objects = CollisionObject.from_collision_meshes(collision_meshes)
+        for co in collision_objects:
+            co.operation = CollisionObject.APPEND
+        world = PlanningSceneWorld(collision_objects=collision_objects)
         scene = PlanningScene(world=world, is_diff=True)
         request = scene.to_request(self.ros_client.ros_distro)
         self.APPLY_PLANNING_SCENE(self.ros_client, request, callback, errback)
@@ -104,7 +104,7 @@ class MoveItPlanCartesianMotion(PlanCartesianMotion):
         joints = options['joints']
 
         header = Header(frame_id=options['base_link'])
-        waypoints = [Pose.from_frame(frame) for frame in frames_WCF]
+        waypoints = Pose.from_frames(frames_WCF)
         joint_state = JointState(header=header,
                                  name=start_configuration.joint_names,
                                  position=start_configuration.joint_values)
@@ -10,8 +10,8 @@ class GoalID(ROSmsg):
     """
     ROS_MSG_TYPE = 'actionlib_msgs/GoalID'
 
-    def __init__(self, stamp=Time(), id=""):
-        self.stamp = stamp
+    def __init__(self, stamp=None, id=""):
+        self.stamp = stamp if stamp is not None else Time()
         self.id = id
 
     @classmethod
@@ -37,8 +37,8 @@ class GoalStatus(ROSmsg):
     RECALLED = 8
     LOST = 9
 
-    def __init__(self, goal_id=GoalID(), status=0, text=''):
-        self.goal_id = goal_id
+    def __init__(self, goal_id=None, status=0, text=''):
+        self.goal_id = goal_id if goal_id is not None else GoalID()
         self.status = status
         self.text = text
 
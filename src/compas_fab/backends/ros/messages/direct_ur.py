@@ -46,9 +46,9 @@ class URPose(URmsg):
     """
     """
 
-    def __init__(self, position=Point(0, 0, 0), orientation=AxisAngle(0, 0, 0)):
-        self.position = position
-        self.orientation = orientation
+    def __init__(self, position=None, orientation=None):
+        self.position = position if position is not None else Point(0, 0, 0)
+        self.orientation = orientation if orientation is not None else AxisAngle(0, 0, 0)
 
     @classmethod
     def from_frame(cls, frame):
@@ -64,8 +64,8 @@ class URPoseTrajectoryPoint(URmsg):
     """
     """
 
-    def __init__(self, pose=URPose(), acceleration=None, velocity=None, time=None, radius=None):
-        self.pose = pose
+    def __init__(self, pose=None, acceleration=None, velocity=None, time=None, radius=None):
+        self.pose = pose if pose is not None else URPose()
         self.acceleration = acceleration  # [m/s^2]
         self.velocity = velocity  # [m/s]
         self.time = time  # [s]
@@ -88,8 +88,8 @@ class URMovej(URmsg):
     """
     """
 
-    def __init__(self, pose_trajectory_point=URPoseTrajectoryPoint()):
-        self.pose_trajectory_point = pose_trajectory_point
+    def __init__(self, pose_trajectory_point=None):
+        self.pose_trajectory_point = pose_trajectory_point if pose_trajectory_point is not None else URPoseTrajectoryPoint()
 
     def __str__(self):
         return "movej(%s)" % self.pose_trajectory_point
@@ -99,8 +99,8 @@ class URMovel(URmsg):
     """
     """
 
-    def __init__(self, pose_trajectory_point=URPoseTrajectoryPoint()):
-        self.pose_trajectory_point = pose_trajectory_point
+    def __init__(self, pose_trajectory_point=None):
+        self.pose_trajectory_point = pose_trajectory_point if pose_trajectory_point is not None else URPoseTrajectoryPoint()
 
     def __str__(self):
         return "movel(%s)" % self.pose_trajectory_point
@@ -110,9 +110,9 @@ class URGoal(URmsg):
     """
     """
 
-    def __init__(self, script_lines=[]):
+    def __init__(self, script_lines=None):
         self.script = "def prog():\n\t"
-        self.script += "\n\t".join([str(line) for line in script_lines])
+        self.script += "\n\t".join([str(line) for line in script_lines or []])
         self.script += "\nend\nprog()\n\n"
 
     @property
@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import struct
+
 from compas.geometry import Frame
 
 import compas_fab.robots
@@ -7,27 +9,109 @@ import compas_fab.robots
 from .std_msgs import Header
 from .std_msgs import ROSmsg
 
+# Binary layouts of the messages as serialized by ROS (little-endian float64)
+_POINT_STRUCT = struct.Struct('<3d')
+_QUATERNION_STRUCT = struct.Struct('<4d')
+
+# Converted orientations, mapping ``(xaxis, yaxis)`` to ``(qw, qx, qy, qz)``
+_QUATERNION_CACHE = {}
+_QUATERNION_CACHE_SIZE = 256
+
+
+def _quaternion_from_frame(frame):
+    """Return the quaternion coefficients ``(w, x, y, z)`` of a frame's orientation.
+
+    Frames often share their orientation and only differ in their point
+    (e.g. a stack of collision meshes), so conversions are cached by axes;
+    the point does not affect the quaternion.
+    """
+    axes = (tuple(frame.xaxis), tuple(frame.yaxis))
+    quaternion = _QUATERNION_CACHE.get(axes)
+    if quaternion is None:
+        if len(_QUATERNION_CACHE) >= _QUATERNION_CACHE_SIZE:
+            _QUATERNION_CACHE.clear()
+        quaternion = tuple(frame.quaternion)
+        _QUATERNION_CACHE[axes] = quaternion
+    return quaternion
+
+
+def _read_only(cls, **fields):
+    """Create a read-only instance of a slotted message class, to be shared as a constant."""
+    def __setattr__(self, name, value):
+        raise AttributeError('{}.{} is read-only, assign a new instance instead'.format(cls.__name__, name))
+
+    def __delattr__(self, name):
+        raise AttributeError('{}.{} is read-only'.format(cls.__name__, name))
+
+    # Copies can share the constant, pickles restore a regular instance
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (cls, tuple(getattr(self, name) for name in cls.__slots__))
+
+    read_only_cls = type(cls.__name__, (cls,), {'__setattr__': __setattr__,
+                                                '__delattr__': __delattr__,
+                                                '__copy__': __copy__,
+                                                '__deepcopy__': __deepcopy__,
+                                                '__reduce__': __reduce__})
+    instance = object.__new__(read_only_cls)
+    for name in cls.__slots__:
+        object.__setattr__(instance, name, fields[name])
+    return instance
+
 
 class Point(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Point.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Point'
+    __slots__ = ('x', 'y', 'z')
 
     def __init__(self, x, y, z):
         self.x = x
         self.y = y
         self.z = z
 
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Point, self).msg
+        return {'x': self.x, 'y': self.y, 'z': self.z}
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def pack_into(self, buffer, offset=0):
+        """Write the point in its ROS binary layout into ``buffer`` at ``offset``.
+
+        Returns the offset right after the written data.
+        """
+        _POINT_STRUCT.pack_into(buffer, offset, self.x, self.y, self.z)
+        return offset + _POINT_STRUCT.size
+
     @classmethod
     def from_msg(cls, msg):
         x, y, z = msg['x'], msg['y'], msg['z']
         return cls(x, y, z)
 
 
+Point.ORIGIN = _read_only(Point, x=0., y=0., z=0.)
+
+
 class Quaternion(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Quaternion.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Quaternion'
+    __slots__ = ('x', 'y', 'z', 'w')
 
     def __init__(self, x=0., y=0., z=0., w=1.):
         self.x = x
@@ -35,49 +119,115 @@ class Quaternion(ROSmsg):
         self.z = z
         self.w = w
 
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Quaternion, self).msg
+        return {'x': self.x, 'y': self.y, 'z': self.z, 'w': self.w}
+
+    def __eq__(self, other):
+        return isinstance(other, Quaternion) and (self.x, self.y, self.z, self.w) == (other.x, other.y, other.z, other.w)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z, self.w))
+
+    def pack_into(self, buffer, offset=0):
+        """Write the quaternion in its ROS binary layout into ``buffer`` at ``offset``.
+
+        Returns the offset right after the written data.
+        """
+        _QUATERNION_STRUCT.pack_into(buffer, offset, self.x, self.y, self.z, self.w)
+        return offset + _QUATERNION_STRUCT.size
+
+    @classmethod
+    def from_msg(cls, msg):
+        x, y, z, w = msg['x'], msg['y'], msg['z'], msg['w']
+        return cls(x, y, z, w)
+
     @classmethod
     def from_frame(cls, frame):
-        qw, qx, qy, qz = frame.quaternion
+        qw, qx, qy, qz = _quaternion_from_frame(frame)
         return cls(qx, qy, qz, qw)
 
 
+Quaternion.IDENTITY = _read_only(Quaternion, x=0., y=0., z=0., w=1.)
+
+
 class Pose(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Pose.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Pose'
+    __slots__ = ('position', 'orientation')
+    BINARY_SIZE = _POINT_STRUCT.size + _QUATERNION_STRUCT.size
 
     def __init__(self, position=None, orientation=None):
-        self.position = position if position else Point(0, 0, 0)
-        self.orientation = orientation if orientation else Quaternion(0, 0, 0, 1)
+        self.position = position if position is not None else Point.ORIGIN
+        self.orientation = orientation if orientation is not None else Quaternion.IDENTITY
+
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Pose, self).msg
+        return {'position': self.position.msg, 'orientation': self.orientation.msg}
+
+    def __eq__(self, other):
+        return isinstance(other, Pose) and self.position == other.position and self.orientation == other.orientation
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.position, self.orientation))
+
+    def pack_into(self, buffer, offset=0):
+        """Write the pose in its ROS binary layout into ``buffer`` at ``offset``.
+
+        Returns the offset right after the written data, so that several poses
+        can be packed one after the other into a buffer of
+        ``len(poses) * Pose.BINARY_SIZE`` bytes.
+        """
+        offset = self.position.pack_into(buffer, offset)
+        return self.orientation.pack_into(buffer, offset)
 
     @classmethod
     def from_frame(cls, frame):
         point = frame.point
-        qw, qx, qy, qz = frame.quaternion
-        return cls(Point(*list(point)), Quaternion(qx, qy, qz, qw))
+        qw, qx, qy, qz = _quaternion_from_frame(frame)
+        return cls(Point(point.x, point.y, point.z), Quaternion(qx, qy, qz, qw))
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Construct a list of poses from a sequence of frames.
+
+        Frames sharing the same orientation are converted to quaternions
+        only once.
+        """
+        return [cls.from_frame(frame) for frame in frames]
 
     @property
     def frame(self):
-        point = [self.position.x, self.position.y, self.position.z]
-        quaternion = [self.orientation.w, self.orientation.x,
-                      self.orientation.y, self.orientation.z]
-        return Frame.from_quaternion(quaternion, point=point)
+        p, o = self.position, self.orientation
+        return Frame.from_quaternion((o.w, o.x, o.y, o.z), point=(p.x, p.y, p.z))
 
     @classmethod
     def from_msg(cls, msg):
-        position = Point.from_msg(msg['position'])
-        orientation = Quaternion.from_msg(msg['orientation'])
-        return cls(position, orientation)
+        p = msg['position']
+        o = msg['orientation']
+        return cls(Point(p['x'], p['y'], p['z']), Quaternion(o['x'], o['y'], o['z'], o['w']))
 
 
 class PoseStamped(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/PoseStamped.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/PoseStamped'
+    __slots__ = ('header', 'pose')
 
     def __init__(self, header=None, pose=None):
-        self.header = header or Header()
-        self.pose = pose or Pose()
+        self.header = header if header is not None else Header()
+        self.pose = pose if pose is not None else Pose()
 
     @classmethod
     def from_msg(cls, msg):
@@ -106,36 +256,81 @@ class Vector3(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Vector3.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Vector3'
+    __slots__ = ('x', 'y', 'z')
 
     def __init__(self, x=0., y=0., z=0.):
         self.x = x
         self.y = y
         self.z = z
 
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Vector3, self).msg
+        return {'x': self.x, 'y': self.y, 'z': self.z}
+
+    def __eq__(self, other):
+        return isinstance(other, Vector3) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
     @classmethod
     def from_msg(cls, msg):
         x, y, z = msg['x'], msg['y'], msg['z']
         return cls(x, y, z)
 
 
+Vector3.ZERO = _read_only(Vector3, x=0., y=0., z=0.)
+
+
 class Transform(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Transform.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Transform'
+    __slots__ = ('translation', 'rotation')
 
     def __init__(self, translation=None, rotation=None):
-        self.translation = translation or Vector3()
-        self.rotation = rotation or Quaternion()
+        self.translation = translation if translation is not None else Vector3.ZERO
+        self.rotation = rotation if rotation is not None else Quaternion.IDENTITY
+
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Transform, self).msg
+        return {'translation': self.translation.msg, 'rotation': self.rotation.msg}
+
+    @classmethod
+    def from_msg(cls, msg):
+        t = msg['translation']
+        r = msg['rotation']
+        return cls(Vector3(t['x'], t['y'], t['z']), Quaternion(r['x'], r['y'], r['z'], r['w']))
 
 
 class Twist(ROSmsg):
     """https://docs.ros.org/api/geometry_msgs/html/msg/Twist.html
     """
     ROS_MSG_TYPE = 'geometry_msgs/Twist'
+    __slots__ = ('linear', 'angular')
 
     def __init__(self, linear=None, angular=None):
-        self.linear = linear or Vector3()
-        self.angular = angular or Vector3()
+        self.linear = linear if linear is not None else Vector3.ZERO
+        self.angular = angular if angular is not None else Vector3.ZERO
+
+    @property
+    def msg(self):
+        if self.__dict__:
+            return super(Twist, self).msg
+        return {'linear': self.linear.msg, 'angular': self.angular.msg}
+
+    @classmethod
+    def from_msg(cls, msg):
+        lin = msg['linear']
+        ang = msg['angular']
+        return cls(Vector3(lin['x'], lin['y'], lin['z']), Vector3(ang['x'], ang['y'], ang['z']))
 
 
 class Wrench(ROSmsg):
@@ -54,18 +54,39 @@ class CollisionObject(ROSmsg):
         self.operation = operation  # ADD or REMOVE or APPEND or MOVE
 
     @classmethod
-    def from_collision_mesh(cls, collision_mesh):
+    def from_collision_mesh(cls, collision_mesh, mesh=None):
         """Creates a collision object from a :class:`compas_fab.robots.CollisionMesh`
+
+        If ``mesh`` is given, it is used as the already converted ``Mesh``
+        message of the collision mesh.
         """
         kwargs = {}
         kwargs['header'] = Header(frame_id=collision_mesh.root_name)
         kwargs['id'] = collision_mesh.id
-        kwargs['meshes'] = [Mesh.from_mesh(collision_mesh.mesh)]
+        kwargs['meshes'] = [mesh if mesh is not None else Mesh.from_mesh(collision_mesh.mesh)]
         kwargs['mesh_poses'] = [Pose.from_frame(collision_mesh.frame)]
         kwargs['pose'] = Pose()
 
         return cls(**kwargs)
 
+    @classmethod
+    def from_collision_meshes(cls, collision_meshes):
+        """Creates a list of collision objects from a list of :class:`compas_fab.robots.CollisionMesh`
+
+        Collision meshes that share the same mesh instance (e.g. copies of the
+        same element placed at different frames) share a single ``Mesh`` message,
+        so each mesh is only converted once.
+        """
+        meshes = {}
+        collision_objects = []
+        for collision_mesh in collision_meshes:
+            mesh_key = id(collision_mesh.mesh)
+            if mesh_key not in meshes:
+                meshes[mesh_key] = Mesh.from_mesh(collision_mesh.mesh)
+            collision_objects.append(cls.from_collision_mesh(collision_mesh, meshes[mesh_key]))
+
+        return collision_objects
+
     @classmethod
     def from_msg(cls, msg):
         kwargs = {}
@@ -92,15 +113,10 @@ class CollisionObject(ROSmsg):
         collision_meshes = []
         for mesh, pose in zip(self.meshes, self.mesh_poses):
             pose = pose if isinstance(pose, Pose) else Pose(**pose)
-            pose.position = pose.position if isinstance(pose.position, Point) else Point(**pose.position)
-            pose.position.x = float(pose.position.x)
-            pose.position.y = float(pose.position.y)
-            pose.position.z = float(pose.position.z)
-            pose.orientation = pose.orientation if isinstance(pose.orientation, Quaternion) else Quaternion(**pose.orientation)
-            pose.orientation.x = float(pose.orientation.x)
-            pose.orientation.y = float(pose.orientation.y)
-            pose.orientation.z = float(pose.orientation.z)
-            pose.orientation.w = float(pose.orientation.w)
+            position = pose.position if isinstance(pose.position, Point) else Point(**pose.position)
+            pose.position = Point(float(position.x), float(position.y), float(position.z))
+            orientation = pose.orientation if isinstance(pose.orientation, Quaternion) else Quaternion(**pose.orientation)
+            pose.orientation = Quaternion(float(orientation.x), float(orientation.y), float(orientation.z), float(orientation.w))
             mesh = mesh if isinstance(mesh, Mesh) else Mesh(**mesh)
             mesh.triangles = [t if isinstance(t, MeshTriangle) else MeshTriangle(**t) for t in mesh.triangles]
             for triangle in mesh.triangles:
@@ -212,10 +228,9 @@ class RobotTrajectory(ROSmsg):
     """
     ROS_MSG_TYPE = 'moveit_msgs/RobotTrajectory'
 
-    def __init__(self, joint_trajectory=JointTrajectory(),
-                 multi_dof_joint_trajectory=MultiDOFJointTrajectory()):
-        self.joint_trajectory = joint_trajectory
-        self.multi_dof_joint_trajectory = multi_dof_joint_trajectory
+    def __init__(self, joint_trajectory=None, multi_dof_joint_trajectory=None):
+        self.joint_trajectory = joint_trajectory if joint_trajectory is not None else JointTrajectory()
+        self.multi_dof_joint_trajectory = multi_dof_joint_trajectory if multi_dof_joint_trajectory is not None else MultiDOFJointTrajectory()
 
     @classmethod
     def from_msg(cls, msg):
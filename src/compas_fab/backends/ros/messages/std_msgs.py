@@ -28,10 +28,34 @@ class ROSmsg(object):
         for k, v in kwargs.items():
             setattr(self, k, v)
 
+    def _fields(self):
+        """Return the ``(name, value)`` pairs of the message's fields.
+
+        Sub-classes that declare ``__slots__`` are read in slot order,
+        everything else is read from the instance dictionary. Attributes
+        assigned outside of the slots still end up in the instance
+        dictionary inherited from ROSmsg; they are kept and follow the slots.
+        """
+        slots = getattr(type(self), '__slots__', None)
+        if slots is None:
+            return self.__dict__.items()
+        fields = [(key, getattr(self, key)) for key in slots]
+        fields.extend(self.__dict__.items())
+        return fields
+
+    def __getstate__(self):
+        # Slotted messages have no instance dictionary for the pickle
+        # protocols 0 and 1 to fall back on, so hand over the fields instead.
+        return dict(self._fields())
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+
     @property
     def msg(self):
         msg = {}
-        for key, value in self.__dict__.items():
+        for key, value in self._fields():
             if hasattr(value, 'msg'):
                 msg[key] = value.msg
             elif isinstance(value, list):
@@ -55,7 +79,7 @@ class ROSmsg(object):
 
     def __repr__(self):
         args = []
-        for key, value in self.__dict__.items():
+        for key, value in self._fields():
             args.append('{}={!r}'.format(key, value))
 
         return '{}({})'.format(self.__class__.__name__, ', '.join(args))
@@ -110,9 +134,9 @@ class Header(ROSmsg):
     """
     ROS_MSG_TYPE = 'std_msgs/Header'
 
-    def __init__(self, seq=0, stamp=Time(), frame_id='/world'):
+    def __init__(self, seq=0, stamp=None, frame_id='/world'):
         self.seq = seq
-        self.stamp = stamp
+        self.stamp = stamp if stamp is not None else Time()
         self.frame_id = frame_id
 
 
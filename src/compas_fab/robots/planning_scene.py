@@ -361,6 +361,43 @@ class PlanningScene(object):
 
         self.robot.client.append_collision_mesh(collision_mesh)
 
+    def append_collision_meshes(self, collision_meshes, scale=False):
+        """Append several collision meshes to the planning scene at once.
+
+        Works like :meth:`~PlanningScene.append_collision_mesh`, but hands all
+        collision meshes to the backend in one call, which allows backends
+        such as ROS to apply them in a single planning scene update.
+
+        Parameters
+        ----------
+        collision_meshes : :obj:`list` of :class:`CollisionMesh`
+            The collision meshes we want to append to the :class:`PlanningScene`.
+        scale : :obj:`bool`, optional
+            If ``True``, the meshes will be copied and scaled according to
+            the robot's scale factor.
+
+        Returns
+        -------
+        ``None``
+
+        Examples
+        --------
+        >>> scene = PlanningScene(robot)
+        >>> mesh = Mesh.from_stl(compas_fab.get('planning_scene/floor.stl'))
+        >>> cms = [CollisionMesh(mesh, 'floor', Frame([0, 0, z], [1, 0, 0], [0, 1, 0])) for z in range(3)]
+        >>> scene.append_collision_meshes(cms)             # doctest: +SKIP
+        """
+        self.ensure_client()
+
+        for collision_mesh in collision_meshes:
+            collision_mesh.root_name = self.robot.root_name
+
+            if scale:
+                scale_factor = 1. / self.robot.scale_factor
+                collision_mesh.scaled(scale_factor)
+
+        self.robot.client.append_collision_mesh(list(collision_meshes))
+
     def add_attached_collision_mesh(self, attached_collision_mesh, scale=False):
         """Add an attached collision object to the planning scene.
 
@@ -5,6 +5,7 @@ import contextlib
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from shutil import copytree
 from shutil import rmtree
 
@@ -12,6 +13,12 @@ from invoke import Exit
 from invoke import task
 
 BASE_FOLDER = os.path.dirname(__file__)
+PYC_SKIP_FOLDERS = ('.git', '.tox', '.venv', 'build', 'dist', 'node_modules')
+
+# Absolute paths of the folders removed by the clean task
+DOCS_FOLDERS = tuple(os.path.join(BASE_FOLDER, folder) for folder in ('docs/_build/', 'docs/api/generated', 'docs/generated', 'dist/'))
+BUILD_FOLDERS = tuple(os.path.join(BASE_FOLDER, folder) for folder in ('build/', 'src/compas_fab.egg-info/'))
+GHUSER_FOLDERS = (os.path.join(BASE_FOLDER, 'src/compas_fab/ghpython/components/ghuser'),)
 
 
 class Log(object):
@@ -19,14 +26,9 @@ class Log(object):
         self.out = out
         self.err = err
 
-    def flush(self):
-        self.out.flush()
-        self.err.flush()
-
     def write(self, message):
-        self.flush()
-        self.out.write(message + '\n')
-        self.out.flush()
+        self.err.flush()
+        print(message, file=self.out, flush=True)
 
     def info(self, message):
         self.write('[INFO] %s' % message)
@@ -67,34 +69,41 @@ def clean(ctx, docs=True, bytecode=True, builds=True, ghuser=True):
     if builds:
         ctx.run('python setup.py clean')
 
-    if bytecode:
-        for root, dirs, files in os.walk(BASE_FOLDER):
-            for f in files:
-                if f.endswith('.pyc'):
-                    os.remove(os.path.join(root, f))
-            if '.git' in dirs:
-                dirs.remove('.git')
-
     folders = []
 
     if docs:
-        folders.append('docs/_build/')
-        folders.append('docs/api/generated')
-        folders.append('docs/generated')
-        folders.append('dist/')
-
-    if bytecode:
-        folders.append('src/compas_fab/__pycache__')
+        folders.extend(DOCS_FOLDERS)
 
     if builds:
-        folders.append('build/')
-        folders.append('src/compas_fab.egg-info/')
+        folders.extend(BUILD_FOLDERS)
 
     if ghuser:
-        folders.append('src/compas_fab/ghpython/components/ghuser')
+        folders.extend(GHUSER_FOLDERS)
+
+    folders = set(os.path.normpath(folder) for folder in folders)
+
+    if bytecode:
+        # Skip folders that are removed anyway, to keep all folders disjoint
+        folders.update(_iter_pycache(BASE_FOLDER, skip=frozenset(folders)))
 
-    for folder in folders:
-        rmtree(os.path.join(BASE_FOLDER, folder), ignore_errors=True)
+    # Folders are disjoint, so they can be removed concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(folders)))) as executor:
+        list(executor.map(lambda folder: rmtree(folder, ignore_errors=True), folders))
+
+
+def _iter_pycache(root, skip=()):
+    """Yields the paths of all ``__pycache__`` folders below ``root``, not descending into the ``skip`` paths."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False) or entry.name in PYC_SKIP_FOLDERS:
+                continue
+            path = os.path.normpath(entry.path)
+            if path in skip:
+                continue
+            if entry.name == '__pycache__':
+                yield path
+            else:
+                yield from _iter_pycache(path, skip)
 
 
 @task(help={
@@ -194,26 +203,45 @@ def test(ctx, checks=False, doctest=False, codeblock=False, coverage=False):
 @task
 def prepare_changelog(ctx):
     """Prepare changelog for next release."""
-    UNRELEASED_CHANGELOG_TEMPLATE = '\nUnreleased\n----------\n\n**Added**\n\n**Changed**\n\n**Fixed**\n\n**Deprecated**\n\n**Removed**\n'
-
     with chdir(BASE_FOLDER):
         # Preparing changelog for next release
-        with open('CHANGELOG.rst', 'r+') as changelog:
-            content = changelog.read()
-            start_index = content.index('----------')
-            start_index = content.rindex('\n', 0, start_index - 1)
-            last_version = content[start_index:start_index + 11].strip()
+        with open('CHANGELOG.rst', 'rb+') as changelog:
+            content = bytearray(changelog.read())
 
-            if last_version == 'Unreleased':
+            if not _insert_unreleased_section(content):
                 log.write('Already up-to-date')
                 return
 
             changelog.seek(0)
-            changelog.write(content[0:start_index] + UNRELEASED_CHANGELOG_TEMPLATE + content[start_index:])
+            changelog.write(content)
 
         ctx.run('git add CHANGELOG.rst && git commit -m "Prepare changelog for next release"')
 
 
+def _insert_unreleased_section(content):
+    """Inserts the unreleased section template in place into the changelog ``content``.
+
+    Returns ``False`` if the changelog already starts with an unreleased section.
+    """
+    UNRELEASED_CHANGELOG_TEMPLATE = 'Unreleased\n----------\n\n**Added**\n\n**Changed**\n\n**Fixed**\n\n**Deprecated**\n\n**Removed**\n\n'
+
+    start_index = content.index(b'----------')
+    start_index = content.rindex(b'\n', 0, start_index - 1) + 1
+    last_version = content[start_index:start_index + 10].strip()
+
+    if last_version == b'Unreleased':
+        return False
+
+    template = UNRELEASED_CHANGELOG_TEMPLATE.encode('utf-8')
+    if b'\r\n' in content:
+        template = template.replace(b'\n', b'\r\n')
+
+    # Insert right after the line break preceding the last version,
+    # only the tail after the insertion point is moved
+    content[start_index:start_index] = template
+    return True
+
+
 @task(help={
       'gh_io_folder': 'Folder where GH_IO.dll is located. If not specified, it will try to download from NuGet.',
       'ironpython': 'Command for running the IronPython executable. Defaults to `ipy`.'})
@@ -0,0 +1,29 @@
+from compas.datastructures import Mesh
+from compas.geometry import Box
+
+from compas_fab.backends.pybullet.backend_features import PyBulletAppendCollisionMesh
+from compas_fab.robots import CollisionMesh
+
+
+class FakePyBulletClient(object):
+    def __init__(self):
+        self.collision_objects = {}
+        self.added = []
+
+    def add_collision_mesh(self, collision_mesh, options):
+        self.collision_objects[collision_mesh.id] = [len(self.added)]
+        self.added.append(collision_mesh)
+
+    def convert_mesh_to_body(self, mesh, frame, name, concavity):
+        return -1
+
+
+def test_append_collision_mesh_list():
+    client = FakePyBulletClient()
+    box = Box.from_width_height_depth(1, 1, 1)
+    mesh = Mesh.from_vertices_and_faces(box.vertices, box.faces)
+    cms = [CollisionMesh(mesh, 'brick'), CollisionMesh(mesh, 'brick'), CollisionMesh(mesh, 'plate')]
+    PyBulletAppendCollisionMesh(client).append_collision_mesh(cms, {})
+
+    assert client.added == [cms[0], cms[2]]
+    assert client.collision_objects == {'brick': [0, -1], 'plate': [1]}
@@ -0,0 +1,135 @@
+import copy
+import pickle
+import struct
+
+import pytest
+from compas.geometry import Frame
+
+from compas_fab.backends.ros.messages import Point
+from compas_fab.backends.ros.messages import Pose
+from compas_fab.backends.ros.messages import Quaternion
+from compas_fab.backends.ros.messages import ROSmsg
+from compas_fab.backends.ros.messages import Transform
+from compas_fab.backends.ros.messages import Twist
+from compas_fab.backends.ros.messages import Vector3
+
+
+def test_pose_from_frame():
+    pose = Pose.from_frame(Frame([1, 2, 3], [0, 1, 0], [-1, 0, 0]))
+    assert (pose.position.x, pose.position.y, pose.position.z) == (1, 2, 3)
+    assert pose.frame == Frame([1, 2, 3], [0, 1, 0], [-1, 0, 0])
+
+
+def test_pose_from_frame_reuses_orientation():
+    rotated = Frame([0, 0, 0], [0, 1, 0], [-1, 0, 0])
+    first = Pose.from_frame(rotated)
+    rotated.point.z = 1.
+    second = Pose.from_frame(rotated)
+    assert second.position.z == 1.
+    assert second.orientation.msg == first.orientation.msg
+
+    worldxy = Quaternion.from_frame(Frame.worldXY())
+    assert (worldxy.x, worldxy.y, worldxy.z, worldxy.w) == (0., 0., 0., 1.)
+
+
+def test_pose_msg():
+    pose = Pose.from_frame(Frame.worldXY())
+    assert pose.msg == {'position': {'x': 0.0, 'y': 0.0, 'z': 0.0}, 'orientation': {'x': 0.0, 'y': 0.0, 'z': 0.0, 'w': 1.0}}
+    assert Pose.from_msg(pose.msg).msg == pose.msg
+
+
+def test_pose_from_frames():
+    frames = [Frame([0, 0, i], [0, 1, 0], [-1, 0, 0]) for i in range(3)]
+    poses = Pose.from_frames(frames)
+    assert [p.msg for p in poses] == [Pose.from_frame(f).msg for f in frames]
+
+
+def test_transform_and_twist_msg():
+    transform = Transform(Vector3(1., 2., 3.))
+    assert transform.msg == {'translation': {'x': 1., 'y': 2., 'z': 3.}, 'rotation': {'x': 0., 'y': 0., 'z': 0., 'w': 1.}}
+    assert Twist().msg == {'linear': {'x': 0., 'y': 0., 'z': 0.}, 'angular': {'x': 0., 'y': 0., 'z': 0.}}
+
+
+def test_transform_and_twist_from_msg():
+    transform = {'translation': {'x': 1., 'y': 2., 'z': 3.}, 'rotation': {'x': 0., 'y': 1., 'z': 0., 'w': 0.}}
+    twist = {'linear': {'x': 1., 'y': 0., 'z': 0.}, 'angular': {'x': 0., 'y': 0., 'z': 0.5}}
+    assert ROSmsg.parse(transform, 'geometry_msgs/Transform').msg == transform
+    assert ROSmsg.parse(twist, 'geometry_msgs/Twist').msg == twist
+
+
+def test_pose_from_frames_alternating_orientations():
+    frames = [Frame([0, 0, i], [0, 1, 0], [-1, 0, 0]) if i % 2 else Frame([0, 0, i], [1, 0, 0], [0, 1, 0]) for i in range(4)]
+    poses = Pose.from_frames(frames)
+    for pose, frame in zip(poses, frames):
+        assert pose.frame == frame
+
+
+def test_quaternion_defaults_to_identity():
+    assert Quaternion().msg == {'x': 0., 'y': 0., 'z': 0., 'w': 1.}
+    assert Pose().orientation.msg == Quaternion().msg
+    assert Quaternion.from_msg({'x': 0., 'y': 1., 'z': 0., 'w': 0.}).y == 1.
+
+
+def test_default_fields_are_read_only_constants():
+    pose = Pose()
+    assert pose.position is Point.ORIGIN
+    assert pose.orientation is Quaternion.IDENTITY
+    assert Twist().linear is Vector3.ZERO
+    assert repr(pose) == 'Pose(position=Point(x=0.0, y=0.0, z=0.0), orientation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0))'
+
+    with pytest.raises(AttributeError):
+        pose.position.x = 1.
+    pose.position = Point(1., 0., 0.)
+    assert Point.ORIGIN.x == 0.
+
+
+def test_default_fields_copy_and_pickle():
+    pose = Pose()
+    assert copy.copy(pose.position) is Point.ORIGIN
+    assert copy.deepcopy(pose).orientation is Quaternion.IDENTITY
+    assert copy.deepcopy(Twist()).linear is Vector3.ZERO
+
+    for protocol in range(3):
+        restored = pickle.loads(pickle.dumps(pose, protocol))
+        assert restored == pose
+        assert type(restored.position) is Point
+        restored.position.x = 1.
+        assert Point.ORIGIN.x == 0.
+
+
+def test_pack_poses_into_buffer():
+    poses = [Pose(Point(1., 2., 3.)), Pose(orientation=Quaternion(0., 1., 0., 0.))]
+    buffer = bytearray(len(poses) * Pose.BINARY_SIZE)
+    offset = 0
+    for pose in poses:
+        offset = pose.pack_into(buffer, offset)
+
+    assert offset == len(buffer) == 112
+    assert struct.unpack('<14d', bytes(buffer)) == (1., 2., 3., 0., 0., 0., 1., 0., 0., 0., 0., 1., 0., 0.)
+
+
+def test_equality_and_hash():
+    assert Point(1., 2., 3.) == Point(1., 2., 3.)
+    assert Point(1., 2., 3.) != Point(1., 2., 4.)
+    assert Point(1., 2., 3.) != Vector3(1., 2., 3.)
+    assert Quaternion() == Quaternion.IDENTITY
+    assert Pose() == Pose(Point(0., 0., 0.), Quaternion(0., 0., 0., 1.))
+    assert len({Pose(), Pose(), Pose(Point(1., 0., 0.))}) == 2
+
+
+def test_slotted_messages_pickle():
+    pose = Pose(Point(1., 2., 3.), Quaternion(0., 1., 0., 0.))
+    twist = Twist(Vector3(1., 0., 0.), Vector3(0., 0., 0.5))
+    for protocol in range(3):
+        assert pickle.loads(pickle.dumps(pose, protocol)) == pose
+        assert pickle.loads(pickle.dumps(twist, protocol)).msg == twist.msg
+
+
+def test_slotted_messages_keep_extra_attributes():
+    point = Point(1., 2., 3.)
+    point.foo = 1
+    assert point.msg == {'x': 1., 'y': 2., 'z': 3., 'foo': 1}
+    assert Pose(point).msg['position'] == point.msg
+    assert repr(point) == 'Point(x=1.0, y=2.0, z=3.0, foo=1)'
+    assert pickle.loads(pickle.dumps(point, 0)).foo == 1
+    assert Point(1., 2., 3.).msg == {'x': 1., 'y': 2., 'z': 3.}
@@ -82,3 +82,10 @@ def test_posearray():
     p = [Pose.from_frame(f) for f in [Frame.worldXY()]]
     m = PoseArray(header=Header(), poses=p)
     assert(repr(m) == "PoseArray(header=Header(seq=0, stamp=Time(secs=0, nsecs=0), frame_id='/world'), poses=[Pose(position=Point(x=0.0, y=0.0, z=0.0), orientation=Quaternion(x=0.0, y=0.0, z=0.0, w=1.0))])")  # noqa E501
+
+
+def test_header_default_stamp_not_shared():
+    a = Header()
+    b = Header()
+    a.stamp.secs = 10
+    assert b.stamp.secs == 0
@@ -0,0 +1,40 @@
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+
+from compas_fab.backends.ros.backend_features import MoveItAppendCollisionMesh
+from compas_fab.backends.ros.messages import CollisionObject
+from compas_fab.backends.ros.messages import RosDistro
+from compas_fab.robots import CollisionMesh
+
+
+class FakeRosClient(object):
+    ros_distro = RosDistro.NOETIC
+
+
+def test_append_collision_meshes_in_one_request():
+    requests = []
+    feature = MoveItAppendCollisionMesh(FakeRosClient())
+    feature.APPLY_PLANNING_SCENE = lambda client, request, callback, errback: requests.append(request)
+
+    box = Box.from_width_height_depth(1, 1, 1)
+    mesh = Mesh.from_vertices_and_faces(box.vertices, box.faces)
+    cms = [CollisionMesh(mesh, 'brick', Frame([0, 0, z], [1, 0, 0], [0, 1, 0])) for z in range(3)]
+    feature.append_collision_mesh_async(None, None, cms)
+
+    assert len(requests) == 1
+    collision_objects = requests[0]['scene'].world.collision_objects
+    assert [co.operation for co in collision_objects] == [CollisionObject.APPEND] * 3
+    assert [co.mesh_poses[0].position.z for co in collision_objects] == [0, 1, 2]
+
+
+def test_collision_objects_share_mesh_message():
+    box = Box.from_width_height_depth(1, 1, 1)
+    mesh = Mesh.from_vertices_and_faces(box.vertices, box.faces)
+    other = Mesh.from_vertices_and_faces(box.vertices, box.faces)
+    cms = [CollisionMesh(mesh, 'brick'), CollisionMesh(mesh, 'brick'), CollisionMesh(other, 'brick')]
+    collision_objects = CollisionObject.from_collision_meshes(cms)
+
+    assert collision_objects[0].meshes[0] is collision_objects[1].meshes[0]
+    assert collision_objects[0].meshes[0] is not collision_objects[2].meshes[0]
+    assert collision_objects[0].meshes[0].msg == collision_objects[2].meshes[0].msg
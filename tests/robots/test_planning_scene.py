@@ -0,0 +1,38 @@
+from compas.datastructures import Mesh
+from compas.geometry import Box
+
+from compas_fab.robots import CollisionMesh
+from compas_fab.robots import PlanningScene
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.calls = []
+
+    def append_collision_mesh(self, collision_mesh):
+        self.calls.append(collision_mesh)
+
+
+class FakeRobot(object):
+    root_name = 'base_link'
+    scale_factor = 1000.
+
+    def __init__(self, client):
+        self.client = client
+
+
+def test_append_collision_meshes_in_one_call():
+    client = FakeClient()
+    scene = PlanningScene(FakeRobot(client))
+    box = Box.from_width_height_depth(1000, 1000, 1000)
+    mesh = Mesh.from_vertices_and_faces(box.vertices, box.faces)
+    cms = (CollisionMesh(mesh, 'brick'), CollisionMesh(mesh, 'brick'))
+    scene.append_collision_meshes(cms, scale=True)
+
+    assert len(client.calls) == 1
+    assert client.calls[0] == list(cms)
+    for cm in cms:
+        assert cm.root_name == 'base_link'
+        assert cm.mesh is not mesh
+        assert max(abs(c) for c in cm.mesh.vertex_coordinates(0)) == 0.5
+    assert max(abs(c) for c in mesh.vertex_coordinates(0)) == 500.
@@ -0,0 +1,57 @@
+import compas
+
+if not compas.IPY:
+    from tasks import _insert_unreleased_section
+
+CHANGELOG = '''Changelog
+=========
+
+0.24.0
+----------
+
+**Added**
+
+* Added something
+'''
+
+UPDATED_CHANGELOG = '''Changelog
+=========
+
+Unreleased
+----------
+
+**Added**
+
+**Changed**
+
+**Fixed**
+
+**Deprecated**
+
+**Removed**
+
+0.24.0
+----------
+
+**Added**
+
+* Added something
+'''
+
+
+def test_insert_unreleased_section():
+    if compas.IPY:
+        return
+    for newline in ('\n', '\r\n'):
+        content = bytearray(CHANGELOG.replace('\n', newline).encode('utf-8'))
+        assert _insert_unreleased_section(content)
+        assert content.decode('utf-8') == UPDATED_CHANGELOG.replace('\n', newline)
+
+
+def test_insert_unreleased_section_up_to_date():
+    if compas.IPY:
+        return
+    for newline in ('\n', '\r\n'):
+        content = bytearray(UPDATED_CHANGELOG.replace('\n', newline).encode('utf-8'))
+        assert not _insert_unreleased_section(content)
+        assert content.decode('utf-8') == UPDATED_CHANGELOG.replace('\n', newline)